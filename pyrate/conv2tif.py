@@ -21,8 +21,8 @@ into geotiff format files
 import sys
 import os
 import logging
-from joblib import Parallel, delayed
-import numpy as np
+from functools import partial
+from multiprocessing import get_context
 
 from pyrate.core.prepifg_helper import PreprocessError
 from pyrate.core import shared, mpiops, config as cf, gamma, roipac
@@ -72,7 +72,15 @@ def main(params=None):
         if params[cf.APS_ELEVATION_MAP]:
             base_ifg_paths.append(params[cf.APS_ELEVATION_MAP])
 
-    process_base_ifgs_paths = np.array_split(base_ifg_paths, mpiops.size)[mpiops.rank]
+    # drop repeated inputs (e.g. a DEM also listed as an APS map), keeping
+    # order; compare absolute paths so './dem' and 'dem' match
+    unique_paths = {}
+    for path in base_ifg_paths:
+        unique_paths.setdefault(os.path.abspath(path), path)
+    base_ifg_paths = list(unique_paths.values())
+
+    # interleave paths across MPI ranks, keeping them as plain str
+    process_base_ifgs_paths = base_ifg_paths[mpiops.rank::mpiops.size]
     gtiff_paths = do_geotiff(process_base_ifgs_paths, params)
     log.info("Finished conv2tif")
     return gtiff_paths
@@ -90,12 +98,21 @@ def do_geotiff(base_unw_paths, params):
     parallel = params[cf.PARALLEL]
 
     if parallel:
+        processes = params[cf.PROCESSES]
         log.info("Running geotiff conversion in parallel with {} "
-                 "processes".format(params[cf.PROCESSES]))
-        dest_base_ifgs = Parallel(n_jobs=params[cf.PROCESSES], 
-                         verbose=shared.joblib_log_level(cf.LOG_LEVEL))(
-            delayed(_geotiff_multiprocessing)(p, params)
-            for p in base_unw_paths)
+                 "processes".format(processes))
+        worker = partial(_geotiff_multiprocessing, params=params)
+        # hand out the largest files first, one at a time, so no worker is
+        # left converting a big file after the others have finished
+        by_size = sorted(base_unw_paths, key=os.path.getsize, reverse=True)
+        dests = {}
+        # spawn clean workers rather than forking the MPI/GDAL-initialised parent
+        with get_context('spawn').Pool(processes) as pool:
+            for i, (path, dest) in enumerate(
+                    zip(by_size, pool.imap(worker, by_size)), 1):
+                dests[path] = dest
+                log.info("Converted {} ({}/{})".format(path, i, len(by_size)))
+        dest_base_ifgs = [dests[p] for p in base_unw_paths]
     else:
         log.info("Running geotiff conversion in serial")
         dest_base_ifgs = [_geotiff_multiprocessing(b, params)
@@ -116,8 +133,8 @@ def _geotiff_multiprocessing(unw_path, params):
         dest = shared.output_tiff_filename(unw_path, params[cf.OBS_DIR])
     processor = params[cf.PROCESSOR]  # roipac or gamma
 
-    # Create full-res geotiff if not already on disk
-    if not os.path.exists(dest):
+    # Create full-res geotiff if not already on disk and up to date
+    if not _is_up_to_date(dest, unw_path):
         if processor == GAMMA:
             header = gamma.gamma_header(unw_path, params)
         elif processor == ROIPAC:
@@ -125,9 +142,37 @@ def _geotiff_multiprocessing(unw_path, params):
         else:
             raise PreprocessError('Processor must be ROI_PAC (0) or GAMMA (1)')
         shared.write_fullres_geotiff(header, unw_path, dest,
-                                     nodata=params[cf.NO_DATA_VALUE])
+                                     nodata=params[cf.NO_DATA_VALUE],
+                                     num_threads=_compression_threads(params))
         return dest
     else:
         log.info("Full-res geotiff already exists")
         return None
 
+
+def _compression_threads(params):
+    """
+    Share the cores between conversion processes, or between MPI ranks on
+    the same node, so each does not start a compression thread per core
+    """
+    if params[cf.PARALLEL]:
+        workers = params[cf.PROCESSES]
+    elif mpiops.size > 1:
+        workers = mpiops.node_size
+    else:
+        return 'ALL_CPUS'
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def _is_up_to_date(dest, unw_path):
+    """
+    Check a converted geotiff exists and is no older than its input file
+    or, for ROI_PAC data, the input file's resource header
+    """
+    if not os.path.exists(dest):
+        return False
+    rsc_path = "%s.%s" % (unw_path, roipac.ROI_PAC_HEADER_FILE_EXT)
+    dest_mtime = os.path.getmtime(dest)
+    return all(dest_mtime >= os.path.getmtime(p)
+               for p in (unw_path, rsc_path) if os.path.exists(p))
+
@@ -427,11 +427,8 @@ def write_config_file(params, output_conf_file):
     :rtype: list
     """
     with open(output_conf_file, 'w') as f:
-        for k, v in params.items():
-            if v is not None:
-                f.write(''.join([k, ':\t', str(v), '\n']))
-            else:
-                f.write(''.join([k, ':\t', '', '\n']))
+        f.write(''.join(k + ':\t' + ('' if v is None else str(v)) + '\n'
+                        for k, v in params.items()))
 
 def transform_params(params):
     """
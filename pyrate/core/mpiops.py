@@ -37,6 +37,10 @@ size = comm.Get_size()
 # the rank of the node.
 rank = comm.Get_rank()
 
+# int: the number of nodes in the MPI world sharing this node's memory,
+# i.e. the ranks running on the same physical machine
+node_size = comm.Split_type(MPI.COMM_TYPE_SHARED).Get_size()
+
 
 def run_once(f, *args, **kwargs):
     """
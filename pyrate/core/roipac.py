@@ -62,15 +62,23 @@ RADIANS = "RADIANS"
 ROIPAC = "ROIPAC"
 
 # store type for each of the header items
-INT_HEADERS = [WIDTH, FILE_LENGTH, XMIN, XMAX, YMIN, YMAX, Z_OFFSET, Z_SCALE]
-STR_HEADERS = [X_UNIT, Y_UNIT, ORBIT_NUMBER, DATUM, PROJECTION]
-FLOAT_HEADERS = [X_FIRST, X_STEP, Y_FIRST, Y_STEP, TIME_SPAN_YEAR,
-                 VELOCITY, HEIGHT, EARTH_RADIUS, WAVELENGTH, HEADING_DEG]
-DATE_HEADERS = [DATE, DATE12]
+INT_HEADERS = frozenset([WIDTH, FILE_LENGTH, XMIN, XMAX, YMIN, YMAX,
+                         Z_OFFSET, Z_SCALE])
+STR_HEADERS = frozenset([X_UNIT, Y_UNIT, ORBIT_NUMBER, DATUM, PROJECTION])
+FLOAT_HEADERS = frozenset([X_FIRST, X_STEP, Y_FIRST, Y_STEP, TIME_SPAN_YEAR,
+                           VELOCITY, HEIGHT, EARTH_RADIUS, WAVELENGTH,
+                           HEADING_DEG])
+DATE_HEADERS = frozenset([DATE, DATE12])
 
 ROIPAC_HEADER_LEFT_JUSTIFY = 18
 ROI_PAC_HEADER_FILE_EXT = "rsc"
 
+# parsed headers by path: {path: ((mtime_ns, size), headers)}
+_HEADER_CACHE = {}
+
+# matches 'KEY   value' lines of a ROI_PAC resource file
+_HEADER_LINE = re.compile(r'^\s*(\S+)[ \t]+(.+?)\s*$', re.M)
+
 def parse_date(dstr):
     """
     Parses ROI_PAC 'yymmdd' or 'yymmdd-yymmdd' format string to datetime.
@@ -80,16 +88,24 @@ def parse_date(dstr):
     :return: dstr: datetime string or tuple
     :rtype: str or tuple
     """
-    def to_date(date_str):
-        """convert string to datetime"""
-        year, month, day = [int(date_str[i:i+2]) for i in range(0, 6, 2)]
-        year += 1900 if ((year <= 99) and (year >= 50)) else 2000
-        return datetime.date(year, month, day)
-
-    if "-" in dstr:  # ranged date
-        return tuple([to_date(d) for d in dstr.split("-")])
-    else:
-        return to_date(dstr)
+    first, sep, second = dstr.partition("-")
+    if sep:  # ranged date
+        return _to_date(first), _to_date(second)
+    return _to_date(dstr)
+
+
+def _to_date(date_str):
+    """convert 'yymmdd' string to datetime, pivoting years at 1950"""
+    year = int(date_str[:2])
+    year += 1900 if year >= 50 else 2000
+    return datetime.date(year, int(date_str[2:4]), int(date_str[4:6]))
+
+
+# header key -> type conversion function
+TYPE_MAP = {k: int for k in INT_HEADERS}
+TYPE_MAP.update({k: str for k in STR_HEADERS})
+TYPE_MAP.update({k: float for k in FLOAT_HEADERS})
+TYPE_MAP.update({k: parse_date for k in DATE_HEADERS})
 
 
 def parse_header(hdr_file):
@@ -105,28 +121,20 @@ def parse_header(hdr_file):
         text = f.read()
 
     try:
-        lines = [e.split() for e in text.split("\n") if e != ""]
-        headers = dict(lines)
-        is_dem = True if DATUM in headers or Z_SCALE in headers \
-                         or PROJECTION in headers else False
-        if is_dem and DATUM not in headers:
-            msg = 'No "DATUM" parameter in DEM header/resource file'
-            raise RoipacException(msg)
+        # convert known headers in one pass; ignore other headers
+        headers = {m.group(1): TYPE_MAP[m.group(1)](m.group(2))
+                   for m in _HEADER_LINE.finditer(text)
+                   if m.group(1) in TYPE_MAP}
     except ValueError:
+        headers = {}  # unconvertible value, treat as unparseable
+    if WIDTH not in headers or FILE_LENGTH not in headers:
         msg = "Unable to parse content of %s. Is it a ROIPAC header file?"
         raise RoipacException(msg % hdr_file)
 
-    for k in headers.keys():
-        if k in INT_HEADERS:
-            headers[k] = int(headers[k])
-        elif k in STR_HEADERS:
-            headers[k] = str(headers[k])
-        elif k in FLOAT_HEADERS:
-            headers[k] = float(headers[k])
-        elif k in DATE_HEADERS:
-            headers[k] = parse_date(headers[k])
-        else:  # pragma: no cover
-            pass  # ignore other headers
+    is_dem = DATUM in headers or Z_SCALE in headers or PROJECTION in headers
+    if is_dem and DATUM not in headers:
+        msg = 'No "DATUM" parameter in DEM header/resource file'
+        raise RoipacException(msg)
 
     # grab a subset for GeoTIFF conversion
     subset = {ifc.PYRATE_NCOLS: headers[WIDTH],
@@ -163,6 +171,19 @@ def parse_header(hdr_file):
     return subset
 
 
+def _parse_header_cached(hdr_file):
+    """
+    Memoised parse_header. Entries are checked against the file's mtime and
+    size so edited files are re-read. Returns a copy, as callers modify it.
+    """
+    stat = os.stat(hdr_file)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _HEADER_CACHE.get(hdr_file)
+    if cached is None or cached[0] != stamp:
+        cached = _HEADER_CACHE[hdr_file] = (stamp, parse_header(hdr_file))
+    return dict(cached[1])
+
+
 def _parse_dates_from(filename):
     """Determine dates from file name"""
     # pylint: disable=invalid-name
@@ -192,7 +213,7 @@ def manage_header(header_file, projection):
     :rtype: dict
     """
 
-    header = parse_header(header_file)
+    header = _parse_header_cached(header_file)
     if ifc.PYRATE_DATUM not in header:  # DEM already has DATUM
         header[ifc.PYRATE_DATUM] = projection
     header[ifc.DATA_TYPE] = ifc.ORIG  # non-cropped, non-multilooked geotiff
@@ -206,7 +227,7 @@ def roipac_header(file_path, params):
     """
     rsc_file = os.path.join(params[cf.DEM_HEADER_FILE])
     if rsc_file is not None:
-        projection = parse_header(rsc_file)[ifc.PYRATE_DATUM]
+        projection = _parse_header_cached(rsc_file)[ifc.PYRATE_DATUM]
     else:
         raise RoipacException('No DEM resource/header file is '
                                      'provided')
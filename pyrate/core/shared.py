@@ -22,14 +22,13 @@ all other PyRate modules
 import errno
 import logging
 import math
-from math import floor
 import os
 from os.path import basename, dirname, join
-import struct
 from datetime import date
 from itertools import product
 import numpy as np
-from numpy import where, nan, isnan, sum as nsum, isclose
+from numpy import nan, isnan, sum as nsum
+import numexpr as ne
 import pyproj
 import pkg_resources
 
@@ -59,6 +58,14 @@ GDAL_Y_CELLSIZE = 5
 GDAL_X_FIRST = 0
 GDAL_Y_FIRST = 3
 
+# GeoTIFF creation options for full-res conversion: square DEFLATE tiles
+# keep windowed reads aligned to whole blocks
+GTIFF_BLOCK_SIZE = 256
+GTIFF_CREATION_OPTS = ['TILED=YES',
+                       'BLOCKXSIZE={}'.format(GTIFF_BLOCK_SIZE),
+                       'BLOCKYSIZE={}'.format(GTIFF_BLOCK_SIZE),
+                       'COMPRESS=DEFLATE']
+
 def joblib_log_level(level: str) -> int:
     """
     Convert python log level to joblib int verbosity.
@@ -274,6 +281,7 @@ class Ifg(RasterBase):
         """
         RasterBase.__init__(self, path)
         self._phase_band = None
+        self._phase_array = None
         self._phase_data = None
         self.master = None
         self.slave = None
@@ -340,10 +348,8 @@ class Ifg(RasterBase):
             log.debug(msg)
             return
         else:
-            self.phase_data = where(
-                isclose(self.phase_data, self._nodata_value, atol=1e-6),
-                nan,
-                self.phase_data)
+            self.phase_data = nodata_to_nan(self.phase_data,
+                                            self._nodata_value)
             self.meta_data[ifc.NAN_STATUS] = ifc.NAN_CONVERTED
             self.nan_converted = True
 
@@ -356,6 +362,16 @@ class Ifg(RasterBase):
             self._phase_band = self._get_band(PHASE_BAND)
         return self._phase_band
 
+    @property
+    def phase_array(self):
+        """
+        Returns the phase band as stored on disk, read once and cached.
+        Unlike phase_data, this is not affected by NaN or unit conversion.
+        """
+        if self._phase_array is None:
+            self._phase_array = self.phase_band.ReadAsArray()
+        return self._phase_array
+
     @property
     def nodata_value(self):
         """
@@ -466,6 +482,7 @@ class Ifg(RasterBase):
             assert data_r == self.nrows and data_c == self.ncols
             self.phase_data = data
         self.phase_band.WriteArray(self.phase_data)
+        self._phase_array = None  # band contents on disk have changed
         for k, v in self.meta_data.items():
             self.dataset.SetMetadataItem(k, v)
         self.dataset.FlushCache()
@@ -672,6 +689,30 @@ def convert_radians_to_mm(data, wavelength):
     return data * ifc.MM_PER_METRE * (wavelength / (4 * math.pi))
 
 
+def nodata_to_nan(data, nodata, atol=1e-6, rtol=1e-5):
+    """
+    Function to replace no-data values with NaN, following
+    np.isclose(data, nodata, atol=atol, rtol=rtol) semantics in a single
+    pass, without intermediate mask arrays.
+
+    :param ndarray data: Array containing no-data values
+    :param float nodata: No-data value to replace
+    :param float atol: Absolute tolerance for matching no-data values
+    :param float rtol: Relative tolerance for matching no-data values
+
+    :return: data: float copy of data with no-data values set to NaN
+    :rtype: ndarray
+    """
+    # integer data is promoted to float so it can hold NaN
+    ftype = np.result_type(data.dtype, np.float32).type
+    # infinite nodata only matches by equality, as in np.isclose
+    tol = atol + rtol * abs(nodata) if np.isfinite(nodata) else 0
+    var = {'data': data.astype(ftype, copy=False), 'ndv': ftype(nodata),
+           'tol': ftype(tol), 'nanval': ftype(nan)}
+    formula = 'where((data == ndv) | (abs(data - ndv) <= tol), nanval, data)'
+    return ne.evaluate(formula, local_dict=var)
+
+
 def nanmedian(x):
     """
     Determine the median of values excluding nan values.
@@ -705,7 +746,8 @@ def _is_incidence(hdr):
     return 'FILE_TYPE' in hdr
 
 
-def write_fullres_geotiff(header, data_path, dest, nodata):
+def write_fullres_geotiff(header, data_path, dest, nodata,
+                          num_threads='ALL_CPUS'):
     # pylint: disable=too-many-statements
     """
     Creates a copy of input image data (interferograms, DEM, incidence maps
@@ -715,6 +757,8 @@ def write_fullres_geotiff(header, data_path, dest, nodata):
     :param str data_path: Input file
     :param str dest: Output destination file
     :param float nodata: No-data value
+    :param int|str num_threads: Number of DEFLATE compression threads,
+        or 'ALL_CPUS'
 
     :return: None, file saved to disk
     """
@@ -723,8 +767,9 @@ def write_fullres_geotiff(header, data_path, dest, nodata):
     ifg_proc = header[ifc.PYRATE_INSAR_PROCESSOR]
     ncols = header[ifc.PYRATE_NCOLS]
     nrows = header[ifc.PYRATE_NROWS]
-    bytes_per_col, fmtstr = _data_format(ifg_proc, _is_interferogram(header), ncols)
-    if _is_interferogram(header) and ifg_proc == ROIPAC:
+    bytes_per_col, raw_dtype = _data_format(ifg_proc, _is_interferogram(header))
+    is_roipac_ifg = _is_interferogram(header) and ifg_proc == ROIPAC
+    if is_roipac_ifg:
         # roipac ifg has 2 bands
         _check_raw_data(bytes_per_col*2, data_path, ncols, nrows)
     else:
@@ -747,27 +792,32 @@ def write_fullres_geotiff(header, data_path, dest, nodata):
     # get subset of metadata relevant to PyRate
     md = collate_metadata(header)
 
+    # floating point predictor for float data, horizontal differencing for int
+    predictor = 'PREDICTOR=3' if dtype == 'float32' else 'PREDICTOR=2'
+
     # create GDAL object
     ds = gdal_dataset(dest, ncols, nrows, driver="GTiff", bands=1,
-                 dtype=dtype, metadata=md, crs=wkt,
-                 geotransform=gt, creation_opts=['compress=packbits'])
+                 dtype=dtype, metadata=md, crs=wkt, geotransform=gt,
+                 creation_opts=GTIFF_CREATION_OPTS + [
+                     predictor, 'NUM_THREADS={}'.format(num_threads)])
 
     # copy data from the binary file
     band = ds.GetRasterBand(1)
     band.SetNoDataValue(nodata)
 
-    row_bytes = ncols * bytes_per_col
-
-    with open(data_path, 'rb') as f:
-        for y in range(nrows):
-            if ifg_proc == ROIPAC:
-                if _is_interferogram(header):
-                    f.seek(row_bytes, 1)  # skip interleaved band 1
+    # memory map the binary file so only one block of rows is held in RAM
+    raw_cols = ncols * 2 if is_roipac_ifg else ncols
+    data = np.memmap(data_path, dtype=raw_dtype, mode='r',
+                     shape=(nrows, raw_cols))
+    if is_roipac_ifg:
+        data = data[:, ncols:]  # skip interleaved band 1
+    native_dtype = data.dtype.newbyteorder('=')
 
-            data = struct.unpack(fmtstr, f.read(row_bytes))
-
-            band.WriteArray(np.array(data).reshape(1, ncols), yoff=y)
+    for y in range(0, nrows, GTIFF_BLOCK_SIZE):
+        block = data[y:y + GTIFF_BLOCK_SIZE].astype(native_dtype)
+        band.WriteArray(block, yoff=y)
 
+    del data
     ds = None  # manual close
     del ds
 
@@ -828,24 +878,24 @@ def collate_metadata(header):
     return md
 
 
-def _data_format(ifg_proc, is_ifg, ncols):
+def _data_format(ifg_proc, is_ifg):
     """
-    Convenience function to determine the bytesize and format of input files
+    Convenience function to determine the bytesize and NumPy dtype of input files
     """
     if ifg_proc == GAMMA:
-        fmtstr = '!' + ('f' * ncols)  # data format is big endian float32s
+        dtype = '>f4'  # data format is big endian float32s
         bytes_per_col = 4
     elif ifg_proc == ROIPAC:
         if is_ifg:
-            fmtstr = '<' + ('f' * ncols)  # roipac ifgs are little endian float32s
+            dtype = '<f4'  # roipac ifgs are little endian float32s
             bytes_per_col = 4
         else:
-            fmtstr = '<' + ('h' * ncols)  # roipac DEM is little endian signed int16
+            dtype = '<i2'  # roipac DEM is little endian signed int16
             bytes_per_col = 2
     else:  # pragma: no cover
         msg = 'Unrecognised InSAR Processor: %s' % ifg_proc
         raise GeotiffException(msg)
-    return bytes_per_col, fmtstr
+    return bytes_per_col, dtype
 
 
 def _check_raw_data(bytes_per_col, data_path, ncols, nrows):
@@ -895,13 +945,9 @@ def write_unw_from_data_or_geotiff(geotif_or_data, dest_unw, ifg_proc):
     else:
         data = geotif_or_data
 
-    nrows, ncols = data.shape
-    fmtstr = '!' + ('f' * ncols)  # data format is big endian float32s
-
+    # data format is big endian float32s, written in a single call
     with open(dest_unw, 'wb') as f:
-        for y in range(nrows):
-            col_data = struct.pack(fmtstr, *data[y, :])
-            f.write(col_data)
+        f.write(np.asarray(data, dtype='>f4').tobytes())
 
 
 # This function may be able to be deprecated
@@ -1073,30 +1119,44 @@ def cell_size(lat, lon, x_step, y_step):
     # pylint: disable=invalid-name
     """
     Converts X|Y_STEP in degrees to X & Y cell size in metres.
-    This function depends on PyProj/PROJ4 to implement the function
+    This function depends on PyProj/PROJ4 to implement the function.
+    Latitudes and longitudes may be scalars or arrays of equal shape, in
+    which case all locations are projected with one call per UTM zone.
 
-    :param float lat: Latitude in degrees
-    :param float lon: Longitude in degrees
+    :param float|ndarray lat: Latitude in degrees
+    :param float|ndarray lon: Longitude in degrees
     :param float x_step: Horizontal step size in degrees
     :param float y_step: Vertical step size in degrees
 
-    :return: tuple of X and Y cell size floats
+    :return: tuple of X and Y cell size floats, or arrays for array input
     :rtype: tuple
     """
-    if lat > 84.0 or lat < -80:
+    is_scalar = np.ndim(lat) == 0 and np.ndim(lon) == 0
+    lat, lon = np.broadcast_arrays(np.atleast_1d(lat).astype(np.float64),
+                                   np.atleast_1d(lon).astype(np.float64))
+    if np.any((lat > 84.0) | (lat < -80)):
         msg = "No UTM zone for polar region: > 84 degrees N or < 80 degrees S"
         raise ValueError(msg)
 
-    zone = _utm_zone(lon)
+    zones = _utm_zone_vec(lon)
+    x_size = np.empty(lon.shape)
+    y_size = np.empty(lon.shape)
     p0 = pyproj.Proj(proj='latlong', ellps='WGS84')
-    p1 = pyproj.Proj(proj='utm', zone=zone, ellps='WGS84')
 
-    x0, y0 = pyproj.transform(p0, p1, lon, lat, 
-        errcheck=True)
-    x1, y1 = pyproj.transform(p0, p1, lon + x_step, lat + y_step, 
-        errcheck=True)
+    for zone in np.unique(zones):
+        idx = zones == zone
+        p1 = pyproj.Proj(proj='utm', zone=int(zone), ellps='WGS84')
 
-    return tuple(abs(e) for e in (x1 - x0, y1 - y0))
+        x0, y0 = pyproj.transform(p0, p1, lon[idx], lat[idx],
+            errcheck=True)
+        x1, y1 = pyproj.transform(p0, p1, lon[idx] + x_step, lat[idx] + y_step,
+            errcheck=True)
+        x_size[idx] = np.abs(x1 - x0)
+        y_size[idx] = np.abs(y1 - y0)
+
+    if is_scalar:
+        return x_size.item(), y_size.item()
+    return x_size, y_size
 
 
 def _utm_zone(longitude):
@@ -1105,9 +1165,17 @@ def _utm_zone(longitude):
     Currently does NOT handle the sub-zoning around Scandanavian countries.
     See http://www.dmap.co.uk/utmworld.htm
     """
-    if longitude == 180:
-        return 60.0
-    return floor((longitude + 180) / 6.0) + 1
+    return int(_utm_zone_vec(np.asarray(longitude, dtype=np.float64)))
+
+
+def _utm_zone_vec(longitudes):
+    """
+    Returns basic UTM zones for an array of longitudes in degrees, using
+    arithmetic only so whole arrays are handled in one pass.
+    Longitude 180 is clipped into zone 60.
+    """
+    zones = np.minimum(np.floor((longitudes + 180.0) / 6.0), 59.0) + 1
+    return zones.astype(np.int32)
 
 
 class PrereadIfg():
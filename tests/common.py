@@ -27,7 +27,6 @@ import logging
 from os.path import join
 
 import numpy as np
-from numpy import isnan, sum as nsum
 from osgeo import gdal
 
 from pyrate.core import algorithm, ifgconstants as ifc, config as cf, timeseries, mst, linrate
@@ -187,6 +186,8 @@ class MockIfg(object):
         Creates mock Ifg based on a given interferogram. Size args specify the
         dimensions of the phase band (so the mock ifg can be resized differently
         to the source interferogram for smaller test datasets).
+        The phase data is a view of the source interferogram's phase data;
+        call copy_on_write() before modifying it if the source must not change.
         """
         self.dataset = ifg.dataset
         self.master = ifg.master
@@ -212,7 +213,11 @@ class MockIfg(object):
 
     @property
     def nan_count(self):
-        return nsum(isnan(self.phase_data))
+        return int(np.isnan(self.phase_data).sum())
+
+    def copy_on_write(self):
+        """Detach phase data from the source ifg before modifying it"""
+        self.phase_data = self.phase_data.copy()
 
     @property
     def shape(self):
@@ -3,9 +3,11 @@ import unittest
 import pytest
 import glob
 import copy
+from unittest import mock
 
 import pyrate.core.config as cf
 from pyrate import conv2tif, prepifg
+from pyrate.core import shared
 from tests import common
 
 
@@ -56,11 +58,81 @@ class ConvertToGeotiffTests(unittest.TestCase):
         conv2tif.main(self.gamma_params)
         gtifs = conv2tif.main(self.gamma_params)
         self.assertTrue(all([gt is None for gt in gtifs]))
+
+    def test_stale_conversion_recomputed(self):
+        """
+        If a gtif is older than its input file, conv2tif will convert
+        it again.
+        """
+        gtifs = conv2tif.main(self.gamma_params)
+        for gt in gtifs:
+            os.utime(gt, (0, 0))
+        gtifs = conv2tif.main(self.gamma_params)
+        self.assertTrue(all([gt is not None for gt in gtifs]))
         
+    def test_repeated_input_converted_once(self):
+        """
+        A DEM also given as the APS elevation map, under a different
+        spelling of the same path, is only converted once.
+        """
+        gp_copy = copy.deepcopy(self.gamma_params)
+        gp_copy[cf.APS_ELEVATION_MAP] = os.path.join(
+            os.curdir, gp_copy[cf.DEM_FILE])
+        gtifs = conv2tif.main(gp_copy)
+        dem_tif = shared.output_tiff_filename(gp_copy[cf.DEM_FILE],
+                                              gp_copy[cf.OBS_DIR])
+        self.assertEqual(gtifs.count(dem_tif), 1)
+
+    def test_parallel_results_in_input_order(self):
+        """
+        Parallel conversion runs the largest files first but returns
+        gtif paths in the order of the input paths.
+        """
+        params = copy.deepcopy(self.roipac_params)
+        params[cf.PARALLEL] = True
+        params[cf.PROCESSES] = 2
+        # the int16 DEM is smaller than the 2-band unws, so it runs last
+        unw_paths = [params[cf.DEM_FILE]] + cf.original_ifg_paths(
+            params[cf.IFG_FILE_LIST], params[cf.OBS_DIR])
+        gtifs = conv2tif.do_geotiff(unw_paths, params)
+        exp = [shared.output_tiff_filename(p, params[cf.OBS_DIR])
+               for p in unw_paths]
+        self.assertEqual(gtifs, exp)
+
     def teardown_method(self, method):
         common.remove_tifs(self.gamma_params[cf.OBS_DIR])
         common.remove_tifs(self.roipac_params[cf.OBS_DIR])
  
+class CompressionThreadsTests(unittest.TestCase):
+    """
+    Test DEFLATE compression threads are shared between concurrent
+    conversions.
+    """
+    def setUp(self):
+        self.params = {cf.PARALLEL: False, cf.PROCESSES: 4}
+
+    @mock.patch('os.cpu_count', return_value=16)
+    def test_serial_uses_all_cpus(self, _):
+        self.assertEqual(conv2tif._compression_threads(self.params),
+                         'ALL_CPUS')
+
+    @mock.patch('os.cpu_count', return_value=16)
+    def test_process_pool_shares_cpus(self, _):
+        self.params[cf.PARALLEL] = True
+        self.assertEqual(conv2tif._compression_threads(self.params), 4)
+        self.params[cf.PROCESSES] = 32
+        self.assertEqual(conv2tif._compression_threads(self.params), 1)
+
+    @mock.patch('os.cpu_count', return_value=16)
+    def test_mpi_ranks_share_cpus(self, _):
+        with mock.patch.object(conv2tif.mpiops, 'size', 32), \
+                mock.patch.object(conv2tif.mpiops, 'node_size', 8):
+            self.assertEqual(conv2tif._compression_threads(self.params), 2)
+        with mock.patch.object(conv2tif.mpiops, 'size', 32), \
+                mock.patch.object(conv2tif.mpiops, 'node_size', 32):
+            self.assertEqual(conv2tif._compression_threads(self.params), 1)
+
+
 class PrepifgConversionTests(unittest.TestCase):
     """
     Test that prepifg fails if there are no converted IFGs in the observations
@@ -88,11 +88,13 @@ class MSTTests(unittest.TestCase):
 
         mock_ifgs = [MockIfg(i, 1, 1) for i in self.ifgs]
         for m in mock_ifgs[num_coherent:]:
+            m.copy_on_write()
             m.phase_data[:] = nan
         assert_equal()
 
         # fill in more nans leaving only one ifg
         for m in mock_ifgs[1:num_coherent]:
+            m.copy_on_write()
             m.phase_data[:] = nan
         num_coherent = 1
         assert_equal()
@@ -101,6 +103,7 @@ class MSTTests(unittest.TestCase):
         # ensure full stack of NaNs in an MST pixel classifies to NaN
         mock_ifgs = [MockIfg(i, 1, 1) for i in self.ifgs]
         for m in mock_ifgs:
+            m.copy_on_write()
             m.phase_data[:] = nan
 
         res = mst._mst_matrix_as_array(mock_ifgs)
@@ -114,6 +114,7 @@ class ReferencePixelTests(unittest.TestCase):
         # rig mock data to be below threshold
         mock_ifgs = [MockIfg(i, 6, 7) for i in self.ifgs]
         for m in mock_ifgs:
+            m.copy_on_write()
             m.phase_data[:1] = nan
             m.phase_data[1:5] = 0.1
             m.phase_data[5:] = nan
@@ -129,6 +130,7 @@ class ReferencePixelTests(unittest.TestCase):
         # test step of 1 for refnx|y gets the reference pixel for axis centre
         mock_ifgs = [MockIfg(i, 47, 72) for i in self.ifgs]
         for m in mock_ifgs:
+            m.copy_on_write()
             m.phase_data[:1] = 0.2
             m.phase_data[1:5] = 0.1
             m.phase_data[5:] = 0.3
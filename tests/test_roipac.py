@@ -258,5 +258,62 @@ class HeaderParsingTests(unittest.TestCase):
         self.assertAlmostEqual(hdrs[roipac.X_LAST], 151.8519444445)
         self.assertAlmostEqual(hdrs[roipac.Y_LAST], -34.625)
 
+    def test_parse_indented_header(self):
+        # Ensures leading whitespace on header lines is tolerated
+        with open(SHORT_HEADER_PATH) as f:
+            text = ''.join('  ' + line for line in f)
+        hdr_path = join(TEMPDIR, 'indented_060619-061002.unw.rsc')
+        with open(hdr_path, 'w') as f:
+            f.write(text)
+        try:
+            self.assertEqual(roipac.parse_header(hdr_path),
+                             roipac.parse_header(SHORT_HEADER_PATH))
+        finally:
+            os.remove(hdr_path)
+
+    def test_parse_header_missing_size(self):
+        # Ensures a file without WIDTH/FILE_LENGTH raises a RoipacException
+        hdr_path = join(TEMPDIR, 'nosize_060619-061002.unw.rsc')
+        with open(hdr_path, 'w') as f:
+            f.write('ORBIT_NUMBER\nFOO a b\n')
+        try:
+            self.assertRaises(roipac.RoipacException,
+                              roipac.parse_header, hdr_path)
+        finally:
+            os.remove(hdr_path)
+
+    def test_cached_header_reread_and_copied(self):
+        # Ensures edited headers are re-read and callers get their own copy
+        hdr_path = join(TEMPDIR, 'cached_060619-061002.unw.rsc')
+        shutil.copy(SHORT_HEADER_PATH, hdr_path)
+        try:
+            hdrs = roipac.manage_header(hdr_path, 'WGS84')
+            self.assertEqual(hdrs[ifc.PYRATE_NCOLS], 47)
+            hdrs[ifc.PYRATE_NCOLS] = -1
+            self.assertEqual(roipac._parse_header_cached(hdr_path)[
+                                 ifc.PYRATE_NCOLS], 47)
+
+            with open(SHORT_HEADER_PATH) as f:
+                text = f.read().replace('47', '470', 1)
+            with open(hdr_path, 'w') as f:
+                f.write(text)
+            hdrs = roipac._parse_header_cached(hdr_path)
+            self.assertEqual(hdrs[ifc.PYRATE_NCOLS], 470)
+        finally:
+            os.remove(hdr_path)
+
+    def test_parse_header_bad_value(self):
+        # Ensures a malformed header value raises a RoipacException
+        with open(SHORT_HEADER_PATH) as f:
+            text = f.read().replace('47', 'abc', 1)
+        hdr_path = join(TEMPDIR, 'bad_060619-061002.unw.rsc')
+        with open(hdr_path, 'w') as f:
+            f.write(text)
+        try:
+            self.assertRaises(roipac.RoipacException,
+                              roipac.parse_header, hdr_path)
+        finally:
+            os.remove(hdr_path)
+
 if __name__ == "__main__":
     unittest.main()
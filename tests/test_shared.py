@@ -22,7 +22,6 @@ import shutil
 import sys
 import tempfile
 import unittest
-from itertools import product
 from numpy import isnan, where, nan
 from os.path import join, basename, exists
 from stat import S_IRGRP, S_IWGRP, S_IWOTH, S_IROTH, S_IRUSR, S_IWUSR
@@ -36,7 +35,7 @@ from tests.common import SML_TEST_TIF, SML_TEST_DEM_TIF, TEMPDIR
 from pyrate.core import shared, ifgconstants as ifc, config as cf, prepifg_helper, gamma
 from pyrate import prepifg, conv2tif
 from pyrate.core.shared import Ifg, DEM, RasterException
-from pyrate.core.shared import cell_size, _utm_zone
+from pyrate.core.shared import cell_size, _utm_zone, _utm_zone_vec
 
 from tests import common
 
@@ -70,7 +69,7 @@ class IfgTests(unittest.TestCase):
 
     def test_num_cells(self):
         # test cell size from header elements
-        data = self.ifg.phase_band.ReadAsArray()
+        data = self.ifg.phase_array
         ys, xs = data.shape
         exp_ncells = ys * xs
         self.assertEqual(exp_ncells, self.ifg.num_cells)
@@ -79,31 +78,24 @@ class IfgTests(unittest.TestCase):
         self.assertEqual(self.ifg.shape, self.ifg.phase_data.shape)
 
     def test_nan_count(self):
-        num_nan = 0
-        for row in self.ifg.phase_data:
-            for v in row:
-                if isnan(v):
-                    num_nan += 1
+        num_nan = int(np.count_nonzero(np.isnan(self.ifg.phase_data)))
         if self.ifg.nan_converted:
             self.assertEqual(num_nan, self.ifg.nan_count)
         else:
             self.assertEqual(num_nan, 0)
 
     def test_phase_band(self):
-        data = self.ifg.phase_band.ReadAsArray()
+        data = self.ifg.phase_array
         self.assertEqual(data.shape, (72, 47) )
+        self.assertIs(data, self.ifg.phase_array)  # band read is cached
 
     def test_nan_fraction(self):
         # NB: source data lacks 0 -> NaN conversion
         data = self.ifg.phase_data
         data = where(data == 0, nan, data) # fake 0 -> nan for the count below
 
-        # manually count # nan cells
-        nans = 0
+        nans = int(np.count_nonzero(np.isnan(data)))
         ys, xs = data.shape
-        for y, x in product(range(ys), range(xs)):
-            if isnan(data[y, x]):
-                nans += 1
         del data
 
         num_cells = float(ys * xs)
@@ -462,6 +454,32 @@ class WriteUnwTest(unittest.TestCase):
                     geotif_or_data=g, dest_unw=dest_unw, ifg_proc=0)
 
 
+class NodataToNanTests(unittest.TestCase):
+
+    def test_matches_isclose(self):
+        data = np.random.rand(20, 30).astype(np.float32)
+        data[data < 0.3] = -99.0
+        data[0, 0] = -99.0 + 1e-7
+        exp = where(np.isclose(data, -99.0, atol=1e-6), nan, data)
+        res = shared.nodata_to_nan(data, -99.0)
+        self.assertEqual(res.dtype, np.float32)
+        assert_array_equal(exp, res)
+
+    def test_integer_data(self):
+        data = np.arange(-5, 5, dtype=np.int16).reshape(2, 5)
+        exp = where(np.isclose(data, 0, atol=1e-6), nan, data)
+        res = shared.nodata_to_nan(data, 0)
+        self.assertEqual(res.dtype, np.float32)
+        assert_array_equal(exp, res)
+
+    def test_infinite_nodata(self):
+        data = np.array([[1.0, np.inf, -np.inf], [np.nan, 0.0, np.inf]],
+                        dtype=np.float32)
+        for nodata in (np.inf, -np.inf):
+            exp = where(np.isclose(data, nodata, atol=1e-6), nan, data)
+            assert_array_equal(exp, shared.nodata_to_nan(data, nodata))
+
+
 class GeodesyTests(unittest.TestCase):
 
     def test_utm_zone(self):
@@ -481,6 +499,12 @@ class GeodesyTests(unittest.TestCase):
         for lon in [0.0, 0.275, 3.925, 5.999]:
             self.assertEqual(31, _utm_zone(lon))
 
+    def test_utm_zone_vec(self):
+        lons = np.array([174.0, 176.5, 179.999, 180.0, 144.0, 149.9999,
+                         -180.0, -176.925, -72.0, -66.1, 0.0, 5.999])
+        exp = [60, 60, 60, 60, 55, 55, 1, 1, 19, 19, 31, 31]
+        assert_array_equal(exp, _utm_zone_vec(lons))
+
 
     def test_cell_size_polar_region(self):
         # Can't have polar area zones: see http://www.dmap.co.uk/utmworld.htm
@@ -500,12 +524,15 @@ class GeodesyTests(unittest.TestCase):
         latlons = [(10.0, 15.0), (-10.0, 15.0), (10.0, -15.0), (-10.0, -15.0),
             (178.0, 33.0), (-178.0, 33.0), (178.0, -33.0), (-178.0, -33.0) ]
 
-        for lon, lat in latlons:
-            xs, ys = cell_size(lat, lon, x_deg, y_deg)
-            for s in (xs, ys):
-                self.assertTrue(s > 0, msg="size=%s" % s)
-                self.assertTrue(s > exp_low, msg="size=%s" % s)
-                self.assertTrue(s < exp_high, msg="size=%s" % s)
+        lons, lats = np.array(latlons).T
+        xs, ys = cell_size(lats, lons, x_deg, y_deg)
+        for s in (xs, ys):
+            self.assertTrue(np.all(s > exp_low), msg="size=%s" % s)
+            self.assertTrue(np.all(s < exp_high), msg="size=%s" % s)
+
+        # scalar input gives the same sizes as the batched call
+        for i, (lon, lat) in enumerate(latlons):
+            self.assertEqual((xs[i], ys[i]), cell_size(lat, lon, x_deg, y_deg))
 
 
 if __name__ == "__main__":